@@ -16,26 +16,55 @@ Usage:
     python3 movie_enrich.py --input list.txt --output out.md --api-key YOUR_OMDB_KEY
 
 Requirements:
-    pip install requests beautifulsoup4
+    pip install 'httpx[http2]' lxml diskcache
 
 License: MIT (for the code only; data sources have separate terms)
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
+import asyncio
+import httpx
+import diskcache
+import lxml.html
+from lxml import etree
 import re
+import json
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+from html import unescape
 import argparse
+import os
 import sys
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Tuple, List
+from urllib.parse import quote
+from typing import Dict, List, Mapping, NamedTuple, Optional, TextIO, Tuple
 
 # === Configuration ===
-DEFAULT_DELAY = 2.0  # Conservative delay between requests (seconds)
+DEFAULT_RATE = 8.0  # Starting (and maximum) request rate (requests/second)
+MIN_RATE = 0.2  # Throttling never slows us below one request per 5 seconds
+RATE_INCREASE_INTERVAL = 60  # Seconds without throttling before the rate grows
+MAX_RETRY_AFTER = 120  # Cap on honored Retry-After waits (seconds)
 DEFAULT_TIMEOUT = 10  # Request timeout in seconds
+QUEUE_SIZE = 64  # Parsed movies buffered ahead of the workers
+MAX_IN_FLIGHT = 8  # HTTP requests in flight at once, however many workers run
+OUTPUT_BUFFER_SIZE = 1 << 20  # Output file write buffer (bytes)
+DEFAULT_WORKERS = 8  # Movies processed in parallel; higher values trigger IMDb 503s
 MAX_RETRIES = 3  # Retry failed requests this many times
+RETRY_BACKOFF = 0.5  # Backoff factor: waits 0.5s, 1s, 2s... between retries
+RETRY_STATUSES = frozenset({429, 502, 503, 504})  # Transient errors worth retrying
+THROTTLE_STATUSES = frozenset({429, 503})  # Server asking us to slow down
 OMDB_BASE_URL = "https://www.omdbapi.com/"  # Preferred API endpoint
+TMDB_SEARCH_URL = "https://api.themoviedb.org/3/search/movie"  # Used when --tmdb-key given
+IMDB_SUGGEST_URL = "https://v3.sg.media-imdb.com/suggestion/x/{query}.json"  # Autocomplete JSON
+CACHE_DIR = Path('~/.cache/imdb-blurb').expanduser()  # On-disk lookup cache
+CACHE_TTL = 7 * 86400  # Cached lookups expire after a week (seconds)
+CACHE_VALIDATOR_TTL = 30 * 86400  # Stale pages kept this long for conditional GETs
 
 # Logging setup
 logging.basicConfig(
@@ -44,6 +73,11 @@ logging.basicConfig(
     datefmt='%H:%M:%S'
 )
 logger = logging.getLogger(__name__)
+logging.getLogger('httpx').setLevel(logging.WARNING)  # Silence per-request INFO lines
+
+# Pool for CPU-bound HTML parsing, set up by main(); None means asyncio's
+# default thread pool
+PARSE_EXECUTOR: Optional[Executor] = None
 
 # User-Agent should identify your project, not impersonate a browser
 USER_AGENT = "MovieEnricher/2.0 (Educational; https://github.com/asuspades/imdb-blurb)"
@@ -53,7 +87,22 @@ HEADERS = {
 }
 
 # Pattern to match markdown table rows: | Title | Year |
-ROW_PATTERN = re.compile(r"^\|\s*([^|]+?)\s*\|\s*(\d{4})\s*\|")
+# (Years must be ASCII 0-9; \s stays Unicode so non-breaking spaces still match)
+ROW_PATTERN = re.compile(r"^\|\s*([^|]+?)\s*\|\s*([0-9]{4})\s*\|")
+
+# Compiled once; IMDb's HTML structure changes frequently, so these may break
+SEARCH_RESULT_XPATH = etree.XPath(
+    '//td[contains(concat(" ", normalize-space(@class), " "), " result_text ")]'
+)
+PLOT_XPATHS = [
+    etree.XPath('//*[@data-testid="plot-xl"]'),  # Extended plot
+    etree.XPath('//*[@data-testid="plot-summary__content"]'),  # Summary
+    etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " ipc-html-content ")]'),  # Generic content block
+]
+META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]/@content')
+
+# Structured metadata IMDb embeds in every movie page; holds the canonical plot
+LD_JSON_PATTERN = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.S)
 
 
 def validate_file_path(path_str: str, file_type: str) -> Path:
@@ -68,7 +117,164 @@ def validate_file_path(path_str: str, file_type: str) -> Path:
         raise ValueError(f"Invalid {file_type} path '{path_str}': {e}")
 
 
-def fetch_omdb_plot(title: str, year: str, api_key: Optional[str]) -> Optional[str]:
+class LookupCache:
+    """
+    Persistent cache of scraped lookups, so re-runs skip IMDb entirely
+    
+    Keys are (title.lower(), year) for movie URLs and the URL itself for
+    descriptions. Description entries also keep the page's ETag and
+    Last-Modified validators past their TTL, so stale or --refresh lookups
+    can revalidate with a conditional GET instead of re-downloading.
+    With refresh=True reads are bypassed but fresh results are still written
+    back; without a store every call is a no-op.
+    """
+
+    def __init__(self, store: Optional[diskcache.Cache] = None, refresh: bool = False):
+        self.store = store
+        self.refresh = refresh
+
+    def get(self, key) -> Optional[str]:
+        if self.store is None or self.refresh:
+            return None
+        return self.store.get(key)
+
+    def set(self, key, value: str) -> None:
+        if self.store is not None:
+            self.store.set(key, value, expire=CACHE_TTL)
+
+    def get_entry(self, url: str) -> Optional[dict]:
+        """Return a description entry even if stale; callers check is_fresh()"""
+        if self.store is None:
+            return None
+        entry = self.store.get(url)
+        return entry if isinstance(entry, dict) else None
+
+    def is_fresh(self, entry: dict) -> bool:
+        return not self.refresh and time.time() - entry['fetched'] < CACHE_TTL
+
+    def set_entry(self, url: str, entry: dict) -> None:
+        if self.store is not None:
+            self.store.set(url, entry, expire=CACHE_VALIDATOR_TTL)
+
+
+class RateLimiter:
+    """
+    Adaptive (AIMD) request pacing shared by all workers
+    
+    Requests are spaced 1/current_rate seconds apart on a time.monotonic()
+    schedule. The rate halves whenever the server throttles us and grows by
+    one request/s for every quiet minute, up to max_rate. A Retry-After hint
+    pauses every worker, not just the one that received it.
+    """
+
+    def __init__(self, max_rate: float):
+        self.max_rate = max_rate
+        self.current_rate = max_rate
+        self._next_slot = 0.0
+        self._last_change = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        if self.current_rate < self.max_rate and now - self._last_change >= RATE_INCREASE_INTERVAL:
+            self.current_rate = min(self.max_rate, self.current_rate + 1)
+            self._last_change = now
+            logger.debug(f"No throttling for a minute; rate raised to {self.current_rate:.2f} req/s")
+        
+        wait = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + 1 / self.current_rate
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429/503: halve the rate and honor any Retry-After delay"""
+        now = time.monotonic()
+        # Concurrent requests tend to be throttled together; halve once per burst
+        if now - self._last_change >= 1 / self.current_rate:
+            self.current_rate = max(min(MIN_RATE, self.max_rate), self.current_rate / 2)
+            self._last_change = now
+            logger.warning(f"Server is throttling requests; rate lowered to {self.current_rate:.2f} req/s")
+        if retry_after:
+            self._next_slot = max(self._next_slot, now + retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    headers: Mapping[str, str]
+    text: str
+
+
+class HttpClient:
+    """
+    Shared HTTP/2 session whose requests all pass through one rate limiter
+    
+    A bounded semaphore additionally caps how many requests are in flight at
+    once. Each worker has at most one request outstanding, so the cap only
+    bites when --workers exceeds it; extra workers then queue for a slot.
+    """
+
+    def __init__(self, session: httpx.AsyncClient, limiter: RateLimiter,
+                 max_in_flight: int):
+        self.session = session
+        self.limiter = limiter
+        self.sem = asyncio.BoundedSemaphore(max_in_flight)
+
+    async def fetch(self, url: str, params: Optional[dict] = None,
+                    headers: Optional[dict] = None) -> HttpResponse:
+        """
+        GET a URL and return its status, headers and body text
+        
+        Connection errors, timeouts and 429/5xx responses are retried with
+        jittered exponential backoff (after any Retry-After pause); the last
+        failure is re-raised to the caller.
+        """
+        for attempt in range(MAX_RETRIES):
+            await self.limiter.acquire()
+            try:
+                async with self.sem:
+                    resp = await self.session.get(url, params=params, headers=headers)
+                if resp.status_code >= 400:  # 304 Not Modified is not an error here
+                    resp.raise_for_status()
+                return HttpResponse(resp.status_code, resp.headers, resp.text)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status in THROTTLE_STATUSES:
+                    self.limiter.throttled(parse_retry_after(e.response.headers.get('Retry-After')))
+                if status not in RETRY_STATUSES or attempt == MAX_RETRIES - 1:
+                    raise
+                reason = f"HTTP {status}"
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                reason = str(e) or type(e).__name__
+            
+            backoff = RETRY_BACKOFF * (2 ** attempt)
+            backoff += random.uniform(0, backoff)  # Jitter so workers don't retry in lockstep
+            logger.debug(f"Retrying {url} in {backoff:.1f}s (attempt {attempt + 1}/{MAX_RETRIES}: {reason})")
+            await asyncio.sleep(backoff)
+        
+        raise RuntimeError("unreachable")  # Loop always returns or raises
+
+    async def get(self, url: str, params: Optional[dict] = None) -> str:
+        """GET a URL and return the body text (see fetch() for retry behaviour)"""
+        return (await self.fetch(url, params=params)).text
+
+
+async def fetch_omdb_plot(client: HttpClient, title: str, year: str,
+                          api_key: Optional[str]) -> Optional[str]:
     """
     Fetch movie plot via OMDb API (preferred, ToS-compliant method)
     
@@ -85,46 +291,165 @@ def fetch_omdb_plot(title: str, year: str, api_key: Optional[str]) -> Optional[s
         'apikey': api_key
     }
     
-    for attempt in range(MAX_RETRIES):
-        try:
-            logger.debug(f"OMDb request (attempt {attempt + 1}): {title} ({year})")
-            resp = requests.get(
-                OMDB_BASE_URL, 
-                params=params, 
-                headers=HEADERS,
-                timeout=DEFAULT_TIMEOUT
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            
-            if data.get('Response') == 'True' and data.get('Plot'):
-                logger.info(f"✓ Found via OMDb: {title} ({year})")
-                return data['Plot'].strip()
-            elif data.get('Error'):
-                logger.debug(f"OMDb error for '{title}': {data['Error']}")
-                return None
-            return None
-            
-        except requests.RequestException as e:
-            logger.warning(f"OMDb request failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-            continue
-        except ValueError as e:
-            logger.error(f"Failed to parse OMDb JSON response: {e}")
-            return None
+    logger.debug(f"OMDb request: {title} ({year})")
+    try:
+        data = json.loads(await client.get(OMDB_BASE_URL, params=params))
+    except httpx.HTTPStatusError as e:
+        # Don't log the exception itself: its message includes the API key in the URL
+        logger.warning(f"OMDb request failed for {title} ({year}): HTTP {e.response.status_code}")
+        return None
+    except httpx.HTTPError as e:
+        logger.warning(f"OMDb request failed for {title} ({year}): {type(e).__name__}")
+        return None
+    except ValueError as e:
+        logger.error(f"Failed to parse OMDb JSON response: {e}")
+        return None
     
-    logger.warning(f"OMDb lookup failed after {MAX_RETRIES} attempts: {title} ({year})")
+    if data.get('Response') == 'True' and data.get('Plot'):
+        logger.info(f"✓ Found via OMDb: {title} ({year})")
+        return data['Plot'].strip()
+    elif data.get('Error'):
+        logger.debug(f"OMDb error for '{title}': {data['Error']}")
     return None
 
 
-def fetch_imdb_url_scrape(title: str, year: str) -> Optional[str]:
+async def fetch_tmdb_plot(client: HttpClient, title: str, year: str,
+                          api_key: Optional[str]) -> Optional[str]:
+    """
+    Fetch movie overview via TMDB's search API (ToS-compliant, no HTML parsing)
+    
+    A single search call returns the overview, so no details request is made.
+    Returns overview string if successful, None if API call fails or not found.
     """
-    ⚠️  FALLBACK ONLY: Scrape IMDb search results for movie URL
+    if not api_key:
+        return None
+    
+    params = {
+        'query': title,
+        'year': year,
+        'include_adult': 'false',
+        'api_key': api_key
+    }
+    
+    logger.debug(f"TMDB request: {title} ({year})")
+    try:
+        data = json.loads(await client.get(TMDB_SEARCH_URL, params=params))
+        results = data['results']
+    except httpx.HTTPStatusError as e:
+        # Don't log the exception itself: its message includes the API key in the URL
+        logger.warning(f"TMDB request failed for {title} ({year}): HTTP {e.response.status_code}")
+        return None
+    except httpx.HTTPError as e:
+        logger.warning(f"TMDB request failed for {title} ({year}): {type(e).__name__}")
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Failed to parse TMDB JSON response: {e!r}")
+        return None
+    
+    # Prefer an exact release-year match; TMDB's year filter also matches re-releases
+    matches = [r for r in results if str(r.get('release_date', '')).startswith(year)] or results
+    if matches and (overview := (matches[0].get('overview') or '').strip()):
+        logger.info(f"✓ Found via TMDB: {title} ({year})")
+        return overview
+    logger.debug(f"No TMDB overview for '{title}' ({year})")
+    return None
+
+
+def _parse_html(page: str) -> Optional[lxml.html.HtmlElement]:
+    """Build an lxml tree for a page, or None if it has no parseable content"""
+    try:
+        return lxml.html.fromstring(page)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _extract_search_result(page: str, year: str) -> Optional[str]:
+    """Pick the best-matching movie URL out of an IMDb search results page"""
+    if (doc := _parse_html(page)) is None:
+        return None
+    results = SEARCH_RESULT_XPATH(doc)
+
+    for cell in results:
+        if year in cell.text_content():
+            link = cell.find('.//a')
+            if link is not None and (href := link.get('href')):
+                path = href.split('?')[0]
+                return f"https://www.imdb.com{path}"
+
+    # Fallback to first result if year match fails
+    if results and (first := results[0].find('.//a')) is not None and (href := first.get('href')):
+        return f"https://www.imdb.com{href.split('?')[0]}"
+
+    return None
+
+
+async def run_parser(func, *args):
+    """
+    Run a module-level page parser on PARSE_EXECUTOR
+    
+    Parsing in separate processes keeps the event loop free to issue requests
+    and lets several pages parse at once on all cores. If the process pool
+    breaks or a call can't be pickled, the pool is swapped for threads and
+    the parse retried once.
+    """
+    global PARSE_EXECUTOR
+    loop = asyncio.get_running_loop()
+    executor = PARSE_EXECUTOR
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except (BrokenProcessPool, PicklingError) as e:
+        if PARSE_EXECUTOR is executor:  # First failure swaps; concurrent ones just retry
+            logger.warning(f"Parse process pool failed ({e!r}); parsing in threads instead")
+            PARSE_EXECUTOR = ThreadPoolExecutor()
+            if executor is not None:
+                executor.shutdown(wait=False)
+        return await loop.run_in_executor(PARSE_EXECUTOR, func, *args)
+
+
+def _extract_ld_description(page: str) -> Optional[str]:
+    """Read the plot from the page's JSON-LD block, skipping DOM parsing entirely"""
+    if not (m := LD_JSON_PATTERN.search(page)):
+        return None
+    try:
+        data = json.loads(m.group(1))
+    except ValueError:
+        return None
+    if isinstance(data, dict) and isinstance(desc := data.get('description'), str):
+        return unescape(desc).strip() or None
+    return None
+
+
+def _extract_plot(page: str) -> str:
+    """Pull the plot text out of an IMDb movie page"""
+    if (doc := _parse_html(page)) is None:
+        return 'Description unavailable.'
+
+    # Try multiple selectors in order of preference (subject to change)
+    for xpath in PLOT_XPATHS:
+        for element in xpath(doc)[:1]:
+            text = element.text_content().strip()
+            if text and text.lower() not in ['no plot found', 'description not found']:
+                return text
+    
+    # Last resort: meta description (often truncated)
+    if (contents := META_DESCRIPTION_XPATH(doc)) and (content := contents[0]):
+        # Remove common suffixes added by IMDb
+        cleaned = re.split(r'\.\s*(?:Directed by|Starring|Watch now)', content)[0].strip()
+        return cleaned + '.' if cleaned else 'Description unavailable.'
+    
+    return 'Description unavailable.'
+
+
+async def fetch_imdb_url(client: HttpClient, title: str,
+                         year: str) -> Optional[str]:
+    """
+    ⚠️  FALLBACK ONLY: Find a movie's IMDb URL
     
     WARNING: This may violate IMDb's Terms of Service. Use only for personal,
     non-commercial, educational purposes with explicit consent.
     
+    Queries IMDb's autocomplete JSON (a few KB) and only falls back to scraping
+    the search results page when it has no matching movie.
     Returns IMDb movie page URL if found, None otherwise.
     """
     logger.warning(
@@ -132,6 +457,28 @@ def fetch_imdb_url_scrape(title: str, year: str) -> Optional[str]:
         "This may violate IMDb's Terms of Service. Consider using OMDb API instead."
     )
     
+    url = IMDB_SUGGEST_URL.format(query=quote(title, safe=''))
+    try:
+        data = json.loads(await client.get(url, params={'includeVideos': '0'}))
+        hits = [d for d in data['d'] if d.get('y') == int(year) and d.get('qid') == 'movie']
+        if hits:
+            return f"https://www.imdb.com/title/{hits[0]['id']}/"
+        logger.debug(f"No IMDb suggestion matched '{title}' ({year}); trying search page")
+    except httpx.HTTPError as e:
+        logger.debug(f"IMDb suggestion request failed: {e}; trying search page")
+    except (ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Unexpected IMDb suggestion response for '{title}': {e!r}; trying search page")
+    
+    return await fetch_imdb_url_scrape(client, title, year)
+
+
+async def fetch_imdb_url_scrape(client: HttpClient, title: str,
+                                year: str) -> Optional[str]:
+    """
+    Scrape IMDb's HTML search results page for a movie URL
+    
+    Returns IMDb movie page URL if found, None otherwise.
+    """
     base_url = 'https://www.imdb.com/find'
     params = {
         'q': f"{title} {year}",
@@ -139,80 +486,95 @@ def fetch_imdb_url_scrape(title: str, year: str) -> Optional[str]:
         'ttype': 'ft',  # Feature film
     }
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(
-                base_url, 
-                params=params, 
-                headers=HEADERS,
-                timeout=DEFAULT_TIMEOUT
-            )
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            logger.warning(f"IMDb search request failed (attempt {attempt + 1}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(DEFAULT_DELAY * (attempt + 1))
-                continue
-            return None
-
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        # Note: IMDb's HTML structure changes frequently; this selector may break
-        results = soup.find_all('td', class_='result_text')
-        
-        for cell in results:
-            text = cell.get_text(strip=True)
-            if year in text:
-                link = cell.find('a')
-                if link and (href := link.get('href')):
-                    path = href.split('?')[0]
-                    return f"https://www.imdb.com{path}"
-        
-        # Fallback to first result if year match fails
-        if results and (first := results[0].find('a')) and (href := first.get('href')):
-            return f"https://www.imdb.com{href.split('?')[0]}"
-        
-        logger.debug(f"No IMDb results matched for '{title}' ({year})")
+    try:
+        page = await client.get(base_url, params=params)
+    except httpx.HTTPError as e:
+        logger.warning(f"IMDb search request failed: {e}")
         return None
+
+    # Parse off the event loop so other in-flight requests keep moving
+    if url := await run_parser(_extract_search_result, page, year):
+        return url
     
+    logger.debug(f"No IMDb results matched for '{title}' ({year})")
     return None
 
 
-def scrape_imdb_description(imdb_url: str) -> str:
+async def scrape_imdb_description(client: HttpClient, imdb_url: str,
+                                  cached: Optional[dict] = None) -> Optional[dict]:
     """
     ⚠️  FALLBACK ONLY: Scrape plot description from IMDb movie page
     
     WARNING: IMDb's HTML structure is unstable. This function may break
     without warning and should not be relied upon for production use.
+    
+    If a previously cached entry is given, its validators are sent as
+    If-None-Match / If-Modified-Since and a 304 reuses its plot unparsed.
+    Returns a fresh cache entry (plot, etag, last_modified, fetched), else the
+    stale `cached` entry if the page could not be fetched or parsed, else None.
     """
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
     try:
-        resp = requests.get(imdb_url, headers=HEADERS, timeout=DEFAULT_TIMEOUT)
-        resp.raise_for_status()
-    except requests.RequestException as e:
+        resp = await client.fetch(imdb_url, headers=headers)
+    except httpx.HTTPError as e:
         logger.error(f"IMDb page request failed: {e}")
-        return 'Description unavailable.'
+        return cached  # A stale description beats none at all
+
+    if resp.status == 304 and cached:
+        logger.debug(f"IMDb page not modified: {imdb_url}")
+        return {**cached, 'fetched': time.time()}
+
+    if not (desc := _extract_ld_description(resp.text)):
+        # JSON-LD missing or malformed: fall back to parsing the page itself
+        desc = await run_parser(_extract_plot, resp.text)
+        if desc == 'Description unavailable.':
+            return cached
+
+    return {
+        'plot': desc,
+        'etag': resp.headers.get('ETag'),
+        'last_modified': resp.headers.get('Last-Modified'),
+        'fetched': time.time(),
+    }
 
-    soup = BeautifulSoup(resp.text, 'html.parser')
 
-    # Try multiple selectors in order of preference (subject to change)
-    selectors = [
-        ('data-testid', 'plot-xl'),  # Extended plot
-        ('data-testid', 'plot-summary__content'),  # Summary
-        ('class_', 'ipc-html-content'),  # Generic content block
-    ]
-    
-    for attr_name, attr_value in selectors:
-        element = soup.find(attrs={attr_name: attr_value})
-        if element and (text := element.get_text(strip=True)):
-            if text and text.lower() not in ['no plot found', 'description not found']:
-                return text
-    
-    # Last resort: meta description (often truncated)
-    if (meta := soup.select_one('meta[name=description]')) and (content := meta.get('content')):
-        # Remove common suffixes added by IMDb
-        cleaned = re.split(r'\.\s*(?:Directed by|Starring|Watch now)', content)[0].strip()
-        return cleaned + '.' if cleaned else 'Description unavailable.'
+class OrderedRowWriter:
+    """
+    Streams table rows to the output file in input order as lookups finish
     
-    return 'Description unavailable.'
+    Rows that complete early are held back only until every row before them
+    has been written, so a crash mid-run still leaves a valid partial table.
+    Results are keyed by (title, year), so one lookup fills every position
+    where a duplicated movie appears in the input; each result is dropped
+    once its last occurrence has been written.
+    """
+
+    def __init__(self, out_f: TextIO, movies: List[Tuple[str, str]]):
+        self.out_f = out_f
+        self.movies = movies
+        self.remaining = Counter(movies)
+        self.results: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+        self.next_pos = 0
+        self.written = 0
+        self.succeeded = 0
+
+    def add(self, movie: Tuple[str, str], row: str, ok: bool) -> None:
+        self.results[movie] = (row, ok)
+        while self.next_pos < len(self.movies) and (
+                (current := self.movies[self.next_pos]) in self.results):
+            row, ok = self.results[current]
+            self.out_f.write(row + '\n')
+            self.next_pos += 1
+            self.written += 1
+            self.succeeded += ok
+            self.remaining[current] -= 1
+            if not self.remaining[current]:
+                del self.remaining[current], self.results[current]
 
 
 def parse_args() -> argparse.Namespace:
@@ -240,12 +602,32 @@ def parse_args() -> argparse.Namespace:
         help='OMDb API key (free at https://www.omdbapi.com/apikey.aspx) - RECOMMENDED'
     )
     parser.add_argument(
-        '--delay', '-d', type=float, default=DEFAULT_DELAY,
-        help=f'Delay between requests in seconds (default: {DEFAULT_DELAY})'
+        '--tmdb-key', type=str, default=None,
+        help='TMDB API key (free at https://www.themoviedb.org/settings/api); used before IMDb scraping'
+    )
+    parser.add_argument(
+        '--rate', '-r', type=float, default=DEFAULT_RATE,
+        help=f'Maximum requests per second; halved automatically when throttled (default: {DEFAULT_RATE})'
+    )
+    parser.add_argument(
+        '--delay', '-d', type=float, default=None,
+        help='Minimum delay between requests in seconds (caps --rate at 1/delay)'
+    )
+    parser.add_argument(
+        '--workers', '-w', type=int, default=DEFAULT_WORKERS,
+        help=f'Number of movies looked up in parallel (default: {DEFAULT_WORKERS})'
     )
     parser.add_argument(
         '--force-scrape', action='store_true',
-        help='Force IMDb scraping even if OMDb API key is provided (NOT RECOMMENDED)'
+        help='Force IMDb scraping even if an OMDb or TMDB API key is provided (NOT RECOMMENDED)'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help=f'Disable the on-disk lookup cache ({CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--refresh', action='store_true',
+        help='Ignore cached lookups but store the fresh results'
     )
     parser.add_argument(
         '--verbose', '-v', action='store_true',
@@ -261,8 +643,15 @@ def parse_args() -> argparse.Namespace:
     args.input_path = validate_file_path(args.input, "input")
     args.output_path = validate_file_path(args.output, "output")
     
-    if args.delay < 1.0:
-        logger.warning(f"Delay {args.delay}s is very short; consider increasing to avoid rate limits")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.delay is not None:
+        if args.delay <= 0:
+            parser.error("--delay must be positive")
+        args.rate = min(args.rate, 1 / args.delay)
     
     return args
 
@@ -286,36 +675,156 @@ def parse_markdown_movies(file_path: Path) -> List[Tuple[str, str]]:
     return movies
 
 
-def get_plot_description(title: str, year: str, api_key: Optional[str], 
-                        force_scrape: bool, delay: float) -> str:
+async def get_plot_description(client: HttpClient, cache: LookupCache,
+                               title: str, year: str, api_key: Optional[str],
+                               tmdb_key: Optional[str], force_scrape: bool) -> str:
     """
-    Get movie plot via OMDb API (preferred) or IMDb scraping (fallback)
+    Get movie plot via OMDb API (preferred), TMDB API, or IMDb scraping (fallback)
     
+    TMDB overviews and scraped URLs/descriptions are served from the lookup
+    cache when present.
     Returns plot string or error message.
     """
     # Try OMDb API first if key provided and not forced to scrape
     if api_key and not force_scrape:
-        if plot := fetch_omdb_plot(title, year, api_key):
+        if plot := await fetch_omdb_plot(client, title, year, api_key):
             return plot
         logger.debug(f"OMDb lookup failed; trying fallback for '{title}'")
     
+    # Then TMDB, which avoids downloading and parsing IMDb pages entirely
+    if tmdb_key and not force_scrape:
+        plot_key = ('tmdb', title.lower(), year)
+        if plot := cache.get(plot_key):
+            return plot
+        if plot := await fetch_tmdb_plot(client, title, year, tmdb_key):
+            cache.set(plot_key, plot)
+            return plot
+        logger.debug(f"TMDB lookup failed; trying fallback for '{title}'")
+    
     # Fallback to scraping (with warning)
-    if imdb_url := fetch_imdb_url_scrape(title, year):
-        time.sleep(delay)  # Be polite between requests
-        return scrape_imdb_description(imdb_url)
+    url_key = (title.lower(), year)
+    if imdb_url := cache.get(url_key):
+        logger.debug(f"Cache hit for '{title}' ({year}): {imdb_url}")
+    elif imdb_url := await fetch_imdb_url(client, title, year):
+        cache.set(url_key, imdb_url)
+    
+    if imdb_url:
+        stale = cache.get_entry(imdb_url)
+        if stale and cache.is_fresh(stale):
+            return stale['plot']
+        if not (entry := await scrape_imdb_description(client, imdb_url, stale)):
+            return 'Description unavailable.'
+        if entry is not stale:  # Don't extend the life of an entry we failed to refresh
+            cache.set_entry(imdb_url, entry)
+        return entry['plot']
     
     return 'Description not found.'
 
 
+async def process_movie(client: HttpClient, cache: LookupCache, idx: int, total: int,
+                        title: str, year: str, args: argparse.Namespace) -> Tuple[str, bool]:
+    """
+    Look up one movie and format its output table row
+
+    Returns the row and whether the lookup succeeded.
+    """
+    logger.info(f"[{idx}/{total}] Processing: '{title}' ({year})")
+    
+    try:
+        desc = await get_plot_description(
+            client, cache, title, year,
+            api_key=args.api_key,
+            tmdb_key=args.tmdb_key,
+            force_scrape=args.force_scrape
+        )
+        # Sanitize description for markdown: escape pipes and newlines
+        safe_desc = desc.replace('|', '\\|').replace('\n', ' ').strip()
+        return f"| {title} | {year} | {safe_desc} |", True
+        
+    except Exception as e:
+        logger.error(f"Unexpected error processing '{title}': {e}")
+        return f"| {title} | {year} | Error retrieving description |", False
+
+
+async def movie_worker(queue: asyncio.Queue, client: HttpClient, cache: LookupCache,
+                       writer: OrderedRowWriter, total: int,
+                       args: argparse.Namespace) -> None:
+    """Consume (idx, title, year) items from the queue until cancelled"""
+    while True:
+        idx, title, year = await queue.get()
+        try:
+            row, ok = await process_movie(client, cache, idx, total, title, year, args)
+            writer.add((title, year), row, ok)
+        finally:
+            queue.task_done()
+
+
+async def feed_queue(queue: asyncio.Queue, movies: List[Tuple[str, str]]) -> None:
+    """Enqueue every movie, then wait until the workers have processed them all"""
+    for idx, (title, year) in enumerate(movies, start=1):
+        await queue.put((idx, title, year))
+    await queue.join()
+
+
+async def enrich_movies(movies: List[Tuple[str, str]], args: argparse.Namespace,
+                        cache: LookupCache, writer: OrderedRowWriter) -> None:
+    """
+    Feed movies through a fixed pool of workers, writing rows as they finish
+    
+    The bounded queue keeps memory proportional to the worker count rather
+    than the length of the list. While one worker waits on a movie page, the
+    others are issuing searches for later movies, so that round trip is
+    already hidden without prefetching within a single movie.
+    
+    Workers only exit by raising (e.g. an OSError writing the output file);
+    the first such exception stops the run and is re-raised to the caller.
+    """
+    limiter = RateLimiter(args.rate)
+    # HTTP/2 multiplexes concurrent requests to one host over a single connection
+    limits = httpx.Limits(max_connections=MAX_IN_FLIGHT,
+                          max_keepalive_connections=MAX_IN_FLIGHT)
+    
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=limits,
+                                 timeout=DEFAULT_TIMEOUT, follow_redirects=True) as session:
+        client = HttpClient(session, limiter, max_in_flight=MAX_IN_FLIGHT)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        workers = [
+            asyncio.create_task(movie_worker(queue, client, cache, writer, len(movies), args))
+            for _ in range(args.workers)
+        ]
+        feeder = asyncio.create_task(feed_queue(queue, movies))
+        
+        try:
+            done, _ = await asyncio.wait([feeder, *workers],
+                                         return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in [feeder, *workers]:
+                task.cancel()
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
+        
+        for task in done:
+            task.result()  # Re-raise a worker failure
+
+
+def create_parse_executor() -> Executor:
+    """Start a process pool for parsing, or threads where processes are unavailable"""
+    try:
+        return ProcessPoolExecutor()
+    except (OSError, NotImplementedError) as e:
+        logger.debug(f"Process pool unavailable ({e}); parsing in threads instead")
+        return ThreadPoolExecutor()
+
+
 def main() -> int:
     """Main execution flow"""
+    global PARSE_EXECUTOR
     args = parse_args()
     
     logger.info(f"Starting movie enrichment (input: {args.input_path})")
     
-    if not args.api_key and not args.force_scrape:
+    if not args.api_key and not args.tmdb_key and not args.force_scrape:
         logger.warning(
-            "No OMDb API key provided and --force-scrape not set. "
+            "No OMDb or TMDB API key provided and --force-scrape not set. "
             "Script will only use IMDb scraping fallback, which may violate ToS. "
             "Get a free key at: https://www.omdbapi.com/apikey.aspx"
         )
@@ -334,46 +843,34 @@ def main() -> int:
     
     logger.info(f"Found {len(movies)} movie entries to process")
     
-    # Process movies
-    results = []
-    success_count = 0
-    
-    for idx, (title, year) in enumerate(movies, start=1):
-        logger.info(f"[{idx}/{len(movies)}] Processing: '{title}' ({year})")
-        
-        try:
-            desc = get_plot_description(
-                title, year, 
-                api_key=args.api_key,
-                force_scrape=args.force_scrape,
-                delay=args.delay
-            )
-            # Sanitize description for markdown: escape pipes and newlines
-            safe_desc = desc.replace('|', '\\|').replace('\n', ' ').strip()
-            results.append(f"| {title} | {year} | {safe_desc} |")
-            success_count += 1
-            
-        except Exception as e:
-            logger.error(f"Unexpected error processing '{title}': {e}")
-            results.append(f"| {title} | {year} | Error retrieving description |")
-        
-        # Rate limiting
-        if idx < len(movies):
-            time.sleep(args.delay)
+    # Look up each distinct movie once; the writer fans results back out
+    unique = list(dict.fromkeys(movies))
+    if len(unique) < len(movies):
+        logger.info(f"{len(movies) - len(unique)} duplicates skipped")
     
-    # Write output
+    # Process movies, streaming rows to the output file as they complete
+    store = None if args.no_cache else diskcache.Cache(str(CACHE_DIR))
+    PARSE_EXECUTOR = create_parse_executor()
     try:
-        with open(args.output_path, 'w', encoding='utf-8') as out_f:
+        with open(args.output_path, 'w', encoding='utf-8',
+                  buffering=OUTPUT_BUFFER_SIZE) as out_f:
             out_f.write("| Title | Year | Description |\n")
             out_f.write("|---|---|---|\n")
-            if results:
-                out_f.write("\n".join(results) + "\n")
-        logger.info(f"✓ Wrote {len(results)} entries to {args.output_path}")
-        logger.info(f"Success rate: {success_count}/{len(movies)} ({100*success_count/len(movies):.1f}%)")
+            writer = OrderedRowWriter(out_f, movies)
+            cache = LookupCache(store, refresh=args.refresh)
+            asyncio.run(enrich_movies(unique, args, cache, writer))
+            out_f.flush()
+            os.fsync(out_f.fileno())
+        logger.info(f"✓ Wrote {writer.written} entries to {args.output_path}")
+        logger.info(f"Success rate: {writer.succeeded}/{len(movies)} ({100*writer.succeeded/len(movies):.1f}%)")
         
     except IOError as e:
         logger.error(f"Failed to write output file: {e}")
         return 1
+    finally:
+        PARSE_EXECUTOR.shutdown()
+        if store is not None:
+            store.close()
     
     return 0
 